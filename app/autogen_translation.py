@@ -4,7 +4,11 @@ Fail-fast, no fallbacks, uses Supabase-driven config, keeps translation-memory c
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
+import re
 from typing import Any, Dict, List, Tuple
 
 import anthropic
@@ -16,12 +20,66 @@ from autogen_ext.models.anthropic import AnthropicChatCompletionClient
 from app.config_loader import get_config_loader
 
 config = get_config_loader()
+logger = logging.getLogger(__name__)
 
+# Markdown links to Telegram posts, e.g. [label](https://t.me/channel/123)
+_TG_LINK_RE = re.compile(r"\[[^\]]+\]\(https://t\.me/[^\)]+\)")
 
+
+@functools.lru_cache(maxsize=None)
 def get_anthropic_client(api_key: str):  # noqa: D401
-    """Legacy helper retained for bot import compatibility."""
+    """Legacy helper retained for bot import compatibility (one client per key)."""
     return anthropic.Anthropic(api_key=api_key)
 
+# Model clients are reused across translations so the httpx pool (and its TLS
+# connections to Anthropic) stays warm. Keyed per event loop because async
+# httpx clients cannot be shared between loops; released by aclose_model_clients().
+_model_clients: Dict[asyncio.AbstractEventLoop, Dict[str, AnthropicChatCompletionClient]] = {}
+
+# Per-call bound for Claude requests; extended thinking needs well over the 30s DB default
+MODEL_TIMEOUT_SECONDS = 120.0
+# Retries on 429/5xx/connection errors before a translation is given up
+MODEL_MAX_RETRIES = 3
+
+
+def _get_model_client(model_id: str) -> AnthropicChatCompletionClient:
+    """Return the cached Claude chat client for model_id on the running loop."""
+    clients = _model_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(model_id)
+    if client is None:
+        client = AnthropicChatCompletionClient(
+            model=model_id,
+            api_key=os.getenv('ANTHROPIC_API_KEY'),
+            timeout=MODEL_TIMEOUT_SECONDS,
+            max_retries=MODEL_MAX_RETRIES,
+            extra_create_args={
+                "thinking": {"budget_tokens": 10_000},
+            },
+        )
+        clients[model_id] = client
+    return client
+
+
+async def aclose_model_clients() -> None:
+    """Close the running loop's cached model clients; call on shutdown/teardown."""
+    # Entries for loops that are already closed can no longer be awaited – just drop them
+    for loop in [loop for loop in _model_clients if loop.is_closed()]:
+        del _model_clients[loop]
+    for client in _model_clients.pop(asyncio.get_running_loop(), {}).values():
+        await client.close()
+
+
+def _compose_system_prompt(shared_guidelines: str, base_prompt: str, memories_formatted: str) -> str:
+    """Build an agent system message: shared guidelines, agent prompt, memory context.
+
+    The memory block replaces a ``{memory_list}`` placeholder when the prompt has
+    one, otherwise it is appended under a "Память" header.
+    """
+    prompt = "\n\n".join((shared_guidelines, base_prompt))
+    if '{memory_list' in prompt:
+        return prompt.format(memory_list=memories_formatted)
+    return "\n\n".join((prompt, f"🔎 Память:\n{memories_formatted}"))
+
 async def _amemory_block(memories: List[Dict[str, Any]], k: int | None = None) -> str:
     """Return full source articles for contextual linking decisions."""
     config = get_config_loader()
@@ -68,14 +126,7 @@ class AutoGenTranslationSystem:
         # Model client (Anthropic Claude vs OpenAI)
         model_id = self.ai_config['model_id']
         if model_id.startswith('claude'):
-            self.model_client = AnthropicChatCompletionClient(
-                model=model_id,
-                api_key=os.getenv('ANTHROPIC_API_KEY'),
-                extra_create_args={
-                    "thinking": {"budget_tokens": 10_000},
-                    "timeout": 120.0  # 2 minute timeout
-                },
-            )
+            self.model_client = _get_model_client(model_id)
         else:#not implemented
             raise ValueError(f"Model {model_id} not supported")
 
@@ -94,11 +145,7 @@ class AutoGenTranslationSystem:
         # Shared Lurkmore guidelines – prepend to each agent's system prompt (library lacks group-level support)
         shared_guidelines = await self.config.aget_prompt('lurkmore_complete_original_prompt')
 
-        translator_prompt = f"{shared_guidelines}\n\n{self.base_translator_prompt}"
-        if '{memory_list' in translator_prompt:
-            translator_prompt = translator_prompt.format(memory_list=memories_formatted)
-        else:
-            translator_prompt = f"{translator_prompt}\n\n🔎 Память:\n{memories_formatted}"
+        translator_prompt = _compose_system_prompt(shared_guidelines, self.base_translator_prompt, memories_formatted)
 
         # Log initial prompts to flow collector
         if flow_collector and flow_collector.autogen_conversation:
@@ -112,11 +159,7 @@ class AutoGenTranslationSystem:
             system_message=translator_prompt,
         )
         # Make the editor memory-aware as well for better critique
-        editor_prompt = f"{shared_guidelines}\n\n{self.base_editor_prompt}"
-        if '{memory_list' in editor_prompt:
-            editor_prompt = editor_prompt.format(memory_list=memories_formatted)
-        else:
-            editor_prompt = f"{editor_prompt}\n\n🔎 Память:\n{memories_formatted}"
+        editor_prompt = _compose_system_prompt(shared_guidelines, self.base_editor_prompt, memories_formatted)
         editor = AssistantAgent(
             name="Editor",
             model_client=self.model_client,
@@ -129,24 +172,22 @@ class AutoGenTranslationSystem:
             termination_condition=TextMentionTermination("APPROVE") | MaxMessageTermination(4),  # Stop when editor approves or after 4 messages
         )
 
-        messages: List[Any] = []
+        turns: List[Tuple[str, str]] = []  # (source, text) per message, extracted once
         conversation_messages = []  # For flow collector
         
         # Log AI translation start for debugging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"🤖 Starting AI translation conversation (max 4 messages, 2min timeout)")
+        logger.info(f"🤖 Starting AI translation conversation (max 4 messages, {MODEL_TIMEOUT_SECONDS:.0f}s timeout per call)")
         
         try:
             async for event in team.run_stream(task=enriched_input):
                 # Collect only TextMessage events (skip TaskResult etc.)
                 if getattr(event, 'content', None):
-                    messages.append(event)
+                    source = getattr(event, 'source', 'unknown')
+                    text = str(event.content)
+                    turns.append((source, text))
                     
                     # Log each message to flow collector
                     if flow_collector:
-                        source = getattr(event, 'source', 'unknown')
-                        text = str(event.content)
                         conversation_messages.append({
                             'source': source,
                             'content': text,
@@ -167,30 +208,24 @@ class AutoGenTranslationSystem:
         
         # Find the approved translation (translator message before APPROVE signal)
         approve_found = False
-        for i, msg in enumerate(messages):
-            source = getattr(msg, 'source', 'unknown')
-            text = str(msg.content)
+        for i, (source, text) in enumerate(turns):
             log_parts.append(f"{source}: {text}")
             
             # If this is an approval signal, use the previous translator message
             if source == 'Editor' and 'APPROVE' in text:
                 approve_found = True
                 # Look backwards for the most recent translator message
-                for j in range(i - 1, -1, -1):
-                    prev_msg = messages[j]
-                    prev_source = getattr(prev_msg, 'source', 'unknown')
+                for prev_source, prev_text in reversed(turns[:i]):
                     if prev_source == 'Translator':
-                        final_translation_text = str(prev_msg.content)
+                        final_translation_text = prev_text
                         break
                 break
         
         # If no APPROVE found, use the last translator message (conversation hit message limit)
         if not approve_found:
             # Find the last substantial translator message
-            for msg in reversed(messages):
-                source = getattr(msg, 'source', 'unknown')
+            for source, text in reversed(turns):
                 if source == 'Translator':
-                    text = str(msg.content)
                     # Use the last translator message as it should be the improved version
                     final_translation_text = text
                     break
@@ -198,7 +233,7 @@ class AutoGenTranslationSystem:
         conversation_log = "\n\n".join(log_parts)
         
         # Log successful completion
-        logger.info(f"✅ AI translation completed: {len(final_translation_text)} chars, {len(messages)} messages")
+        logger.info(f"✅ AI translation completed: {len(final_translation_text)} chars, {len(turns)} messages")
 
         # Let AI handle all link placement - no automatic footer links
         return final_translation_text, conversation_log
@@ -226,17 +261,12 @@ class AutoGenTranslationSystem:
         return " ".join(links)
 
     async def aclose(self) -> None:
-        """Best-effort cleanup for async resources (prevents loop-closed warnings in tests)."""
-        try:
-            model_client = getattr(self, 'model_client', None)
-            # Prefer async close if available
-            if model_client is not None:
-                close_coro = getattr(model_client, 'aclose', None)
-                if callable(close_coro):
-                    await close_coro()
-        except Exception:
-            # Swallow cleanup errors – this is best-effort
-            pass
+        """Release this run's reference to the model client.
+
+        The client itself is shared via _get_model_client and outlives the run;
+        aclose_model_clients() closes it at shutdown.
+        """
+        self.model_client = None
 
 # ---------------------------------------------------------------------------
 # Public API used by bot/tests – mirrors legacy signature
@@ -250,8 +280,7 @@ async def translate_and_link(enriched_input: str, memories: List[Dict[str, Any]]
 
     # Post-process: ensure at least two semantic links to previous messages are present
     try:
-        import re
-        existing_links = re.findall(r"\[[^\]]+\]\(https://t\.me/[^\)]+\)", final_translation_text)
+        existing_links = _TG_LINK_RE.findall(final_translation_text)
         if len(existing_links) < 2:
             references = system._build_reference_links(memories, max_links=3)
             if references:
@@ -263,7 +292,6 @@ async def translate_and_link(enriched_input: str, memories: List[Dict[str, Any]]
     # Note: Memory storage is handled by the main bot flow in save_translation_to_memory()
     # This avoids duplicate saves and ensures proper metadata (message_url, channel_name) is included
 
-    # Cleanup async resources to avoid event loop warnings in tests
     await system.aclose()
 
     return final_translation_text, conversation_log
@@ -9,19 +9,18 @@ import logging
 import time
 import sys
 import uuid
+from itertools import islice
 from pathlib import Path
 from telethon import TelegramClient, events
 from telethon.network import ConnectionTcpAbridged
-from telethon.sessions import StringSession
-import anthropic
+from telethon.tl.types import MessageEntityTextUrl
 from dotenv import load_dotenv
 from .autogen_translation import get_anthropic_client
-from .autogen_translation import translate_and_link
+from .autogen_translation import aclose_model_clients, translate_and_link
 from .config_loader import get_config_loader
 
 from .session_manager import setup_session, save_session_after_auth
-from telethon.errors import SessionPasswordNeededError
-from datetime import datetime, timedelta
+from datetime import datetime
 import argparse
 
 from .vector_store import recall as recall_tm, save_pair
@@ -29,6 +28,17 @@ from .article_extractor import extract_article
 
 # Using translate_and_link for unified semantic linking
 
+def _preview(text, limit):
+    """Return text cut to limit chars with a trailing '...' (single slice, None-safe)."""
+    text = text or ''
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _similarity_stats(similarities):
+    """Return (avg, max, min) of a similarity list, zeros when it is empty."""
+    if not similarities:
+        return 0, 0, 0
+    return sum(similarities) / len(similarities), max(similarities), min(similarities)
+
 class FlowCollector:
     """Collects production flow details for debugging/analysis without affecting core logic"""
     
@@ -42,7 +52,7 @@ class FlowCollector:
         
     def start_flow(self, source_text, message_id=None):
         """Mark the start of translation flow"""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.log_step("flow_start", {
             "source_text_preview": source_text[:100] + "..." if len(source_text) > 100 else source_text,
             "source_text_length": len(source_text),
@@ -53,22 +63,23 @@ class FlowCollector:
     def log_memory_query(self, query_text, memory_results, query_time):
         """Log translation memory query details"""
         similarities = [m.get('similarity', 0.0) for m in memory_results] if memory_results else []
+        avg_similarity, max_similarity, min_similarity = _similarity_stats(similarities)
         
         self.memory_query = {
             "query_text_preview": query_text[:100] + "..." if len(query_text) > 100 else query_text,
             "results_count": len(memory_results) if memory_results else 0,
             "query_time_seconds": query_time,
             "similarities": similarities,
-            "avg_similarity": sum(similarities) / len(similarities) if similarities else 0,
-            "max_similarity": max(similarities) if similarities else 0,
-            "min_similarity": min(similarities) if similarities else 0,
+            "avg_similarity": avg_similarity,
+            "max_similarity": max_similarity,
+            "min_similarity": min_similarity,
             "memory_preview": [
                 {
-                    "source_preview": m.get('source_text', '')[:60] + "..." if len(m.get('source_text', '')) > 60 else m.get('source_text', ''),
-                    "translation_preview": m.get('translation_text', '')[:60] + "..." if len(m.get('translation_text', '')) > 60 else m.get('translation_text', ''),
+                    "source_preview": _preview(m.get('source_text'), 60),
+                    "translation_preview": _preview(m.get('translation_text'), 60),
                     "similarity": m.get('similarity', 0.0)
                 }
-                for m in (memory_results[:5] if memory_results else [])  # First 5 for preview
+                for m in islice(memory_results or (), 5)  # First 5 for preview
             ]
         }
         
@@ -126,7 +137,7 @@ class FlowCollector:
     
     def log_step(self, step_name, details):
         """Log a flow step with timing"""
-        current_time = time.time()
+        current_time = time.perf_counter()
         elapsed = current_time - self.start_time if self.start_time else 0
         
         step = {
@@ -143,7 +154,7 @@ class FlowCollector:
     
     def get_flow_summary(self):
         """Get complete flow summary for analysis"""
-        total_time = time.time() - self.start_time if self.start_time else 0
+        total_time = time.perf_counter() - self.start_time if self.start_time else 0
         
         return {
             "total_time_seconds": total_time,
@@ -248,7 +259,7 @@ anthropic_client = get_anthropic_client(ANTHROPIC_KEY)
 
 def initialize_translation_session(message_id, source_message_text, flow_collector):
     """Initialize flow logging and return start time."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(f"Starting translation and posting for message ID: {message_id}")
     
     if flow_collector:
@@ -271,7 +282,7 @@ def determine_destination_channel_and_links(destination_channel, message_id):
 
 def query_translation_memory(source_message_text, message_id, flow_collector):
     """Query translation memory and return memory data."""
-    memory_start_time = time.time()
+    memory_start_time = time.perf_counter()
     memories = None
     
     try:
@@ -280,7 +291,7 @@ def query_translation_memory(source_message_text, message_id, flow_collector):
 
         # Channel filtering removed: always query global TM
         memories = recall_tm(source_message_text, k=10, channel_name=None)
-        memory_query_time = time.time() - memory_start_time
+        memory_query_time = time.perf_counter() - memory_start_time
 
         if flow_collector:
             flow_collector.log_memory_query(source_message_text, memories, memory_query_time)
@@ -291,7 +302,7 @@ def query_translation_memory(source_message_text, message_id, flow_collector):
             logger.warning(f"❌ No memories found for message {message_id} in {memory_query_time:.3f}s")
 
     except Exception as e:
-        memory_query_time = time.time() - memory_start_time
+        memory_query_time = time.perf_counter() - memory_start_time
         logger.error(f"💥 TM recall failed for message {message_id} after {memory_query_time:.3f}s: {e}", exc_info=True)
         if flow_collector:
             flow_collector.log_memory_query(source_message_text, None, memory_query_time)
@@ -302,18 +313,15 @@ def log_memory_analysis(memories, memory_query_time):
     """Log detailed analysis of retrieved memories."""
     logger.info(f"✅ Found {len(memories)} relevant memories in {memory_query_time:.3f}s")
     
+    # Previews only feed debug lines, so skip building them when DEBUG is off
+    debug = logger.isEnabledFor(logging.DEBUG)
     for i, m in enumerate(memories, 1):
-        similarity = m.get('similarity', 0.0)
-        source_preview = m.get('source_text', '')[:60] + "..." if len(m.get('source_text', '')) > 60 else m.get('source_text', '')
-        translation_preview = m.get('translation_text', '')[:60] + "..." if len(m.get('translation_text', '')) > 60 else m.get('translation_text', '')
-        logger.info(f"  📝 Memory {i}: similarity={similarity:.3f}")
-        logger.debug(f"    Source: {source_preview}")
-        logger.debug(f"    Translation: {translation_preview}")
+        logger.info(f"  📝 Memory {i}: similarity={m.get('similarity', 0.0):.3f}")
+        if debug:
+            logger.debug(f"    Source: {_preview(m.get('source_text'), 60)}")
+            logger.debug(f"    Translation: {_preview(m.get('translation_text'), 60)}")
     
-    similarities = [m.get('similarity', 0.0) for m in memories]
-    avg_similarity = sum(similarities) / len(similarities) if similarities else 0
-    max_similarity = max(similarities) if similarities else 0
-    min_similarity = min(similarities) if similarities else 0
+    avg_similarity, max_similarity, min_similarity = _similarity_stats([m.get('similarity', 0.0) for m in memories])
     
     logger.info(f"📊 Memory stats: avg_sim={avg_similarity:.3f}, max_sim={max_similarity:.3f}, min_sim={min_similarity:.3f}")
     logger.info(f"🔄 Memory context will be provided via system prompt, not user message")
@@ -340,14 +348,14 @@ def append_article_content_if_needed(source_message_text, message_entity_urls, f
 async def perform_translation(enriched_input, memories, flow_collector):
     """Perform the actual translation using AutoGen system."""
     logger.info("Translating in modern Lurkmore style for Israeli Russian audience with editorial system...")
-    translation_start = time.time()
+    translation_start = time.perf_counter()
     
     if flow_collector:
         memory_count = len(memories) if memories else 0
         flow_collector.log_autogen_start(enriched_input, memory_count)
     
     final_translation_text, conversation_log = await translate_and_link(enriched_input, memories, flow_collector)
-    translation_time_ms = int((time.time() - translation_start) * 1000)
+    translation_time_ms = int((time.perf_counter() - translation_start) * 1000)
     
     if flow_collector:
         translation_time_seconds = translation_time_ms / 1000
@@ -381,7 +389,7 @@ async def send_translated_message(client_instance, dst_channel_to_use, final_pos
 
 def save_translation_to_memory(source_message_text, final_translation_text, conversation_log, message_id, sent_message, dst_channel_to_use):
     """Save the translation pair to memory storage."""
-    save_start_time = time.time()
+    save_start_time = time.perf_counter()
     try:
         pair_id = f"{message_id}-right" if message_id else str(uuid.uuid4())
         logger.info(f"💾 Saving translation pair to memory: {pair_id}")
@@ -402,11 +410,11 @@ def save_translation_to_memory(source_message_text, final_translation_text, conv
             message_url=destination_message_url,
             conversation_log=conversation_log,
         )
-        save_time = time.time() - save_start_time
+        save_time = time.perf_counter() - save_start_time
         logger.info(f"✅ Translation pair saved successfully in {save_time:.3f}s: {pair_id}")
         
     except Exception as e:
-        save_time = time.time() - save_start_time
+        save_time = time.perf_counter() - save_start_time
         logger.error(f"💥 TM save failed for {pair_id} after {save_time:.3f}s: {e}", exc_info=True)
 
 async def translate_and_post(client_instance, source_message_text, message_id=None, destination_channel=None, message_entity_urls=None, flow_collector=None):
@@ -416,9 +424,11 @@ async def translate_and_post(client_instance, source_message_text, message_id=No
         
         dst_channel_to_use, source_footer = determine_destination_channel_and_links(destination_channel, message_id)
         
-        memories = query_translation_memory(source_message_text, message_id, flow_collector)
-        
-        enriched_input = append_article_content_if_needed(source_message_text, message_entity_urls, flow_collector)
+        # TM recall and article scraping are independent blocking I/O – run them side by side off the event loop
+        memories, enriched_input = await asyncio.gather(
+            asyncio.to_thread(query_translation_memory, source_message_text, message_id, flow_collector),
+            asyncio.to_thread(append_article_content_if_needed, source_message_text, message_entity_urls, flow_collector),
+        )
         
         final_translation_text, conversation_log = await perform_translation(enriched_input, memories, flow_collector)
         
@@ -426,9 +436,10 @@ async def translate_and_post(client_instance, source_message_text, message_id=No
         
         sent_message = await send_translated_message(client_instance, dst_channel_to_use, final_post_content, flow_collector)
         
-        save_translation_to_memory(source_message_text, final_translation_text, conversation_log, message_id, sent_message, dst_channel_to_use)
+        # Off the event loop, but awaited so the next post's recall sees this pair
+        await asyncio.to_thread(save_translation_to_memory, source_message_text, final_translation_text, conversation_log, message_id, sent_message, dst_channel_to_use)
         
-        logger.info(f"Total processing time for message: {time.time() - start_time:.2f} seconds")
+        logger.info(f"Total processing time for message: {time.perf_counter() - start_time:.2f} seconds")
         
         return sent_message
         
@@ -437,28 +448,12 @@ async def translate_and_post(client_instance, source_message_text, message_id=No
         return False
 
 def extract_message_urls(message):
-    """Extract URLs from message entities."""
+    """Extract hyperlink (TextUrl) URLs from message entities."""
     message_entity_urls = []
-    if hasattr(message, 'entities') and message.entities:
-        for entity in message.entities:
-            if hasattr(entity, 'url') and entity.url:
-                # Entity already has URL property
-                message_entity_urls.append(entity.url)
-                logger.info(f"Found URL entity with direct URL: {entity.url}")
-            elif hasattr(entity, '_') and entity._ == 'MessageEntityTextUrl':
-                # TextUrl entity type
-                if hasattr(entity, 'url'):
-                    message_entity_urls.append(entity.url)
-                    logger.info(f"Found TextUrl entity: {entity.url}")
-            elif hasattr(entity, '_') and entity._ in ('MessageEntityUrl', 'MessageEntityTextUrl'):
-                # Extract URL from the message text using offset and length
-                if hasattr(entity, 'offset') and hasattr(entity, 'length'):
-                    url_text = message.text[entity.offset:entity.offset + entity.length]
-                    if url_text.startswith('http'):
-                        message_entity_urls.append(url_text)
-                        logger.info(f"Extracted URL from text: {url_text}")
-                    else:
-                        logger.info(f"Found URL-like entity but not a valid URL: {url_text}")
+    for entity in message.entities or ():
+        if isinstance(entity, MessageEntityTextUrl):
+            message_entity_urls.append(entity.url)
+            logger.info(f"Found TextUrl entity: {entity.url}")
     return message_entity_urls
 
 async def process_message(client, message, destination_channel=None):
@@ -489,7 +484,7 @@ async def setup_event_handlers(client_instance):
 async def process_recent_posts(client_instance, limit=None, timeout=None):
     # Renamed client to client_instance
     # Get processing limits from database
-    processing_limits = config.get_processing_limits()
+    processing_limits = await config.aget_processing_limits()
     if limit is None:
         limit = processing_limits['batch_message_limit']
     if timeout is None:
@@ -497,7 +492,7 @@ async def process_recent_posts(client_instance, limit=None, timeout=None):
     
     try:
         logger.info(f"Begin processing {limit} most recent posts from channel '{SRC_CHANNEL}'")
-        start_time = time.time()
+        start_time = time.perf_counter()
         fetch_timeout = min(processing_limits['fetch_timeout_seconds'], timeout / 2)
         try:
             messages = await asyncio.wait_for(
@@ -513,7 +508,7 @@ async def process_recent_posts(client_instance, limit=None, timeout=None):
         processed_count = 0
         for msg in reversed(messages):
             if not msg.text: continue
-            if time.time() - start_time > timeout - processing_limits['timeout_buffer_seconds']: # Reserve time buffer
+            if time.perf_counter() - start_time > timeout - processing_limits['timeout_buffer_seconds']: # Reserve time buffer
                 logger.warning("Approaching timeout, stopping batch processing.")
                 break
             logger.info(f"Processing message {msg.id}: {msg.text[:50]}...")
@@ -649,6 +644,15 @@ async def main():
     except Exception as e:
         logger.error(f"Fatal error in main: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        await aclose_model_clients()
 
 if __name__ == "__main__":
+    # uvloop is optional – libuv-backed loop speeds up Telegram/Anthropic network I/O
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,13 +1,16 @@
 """
 Minimal configuration loader for telegram_zoomer.
 Uses Django ORM for consistent database access and automatic audit logging.
-~40 LOC by design – no caching, no type-conversions, no defensive fallbacks.
+~40 LOC by design – no type-conversions, no defensive fallbacks; prompts,
+settings, the default AI model config and per-domain extraction configs are
+cached for a short TTL because every translation reads them.
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Bootstrap Django ORM
 import django
@@ -19,17 +22,22 @@ from asgiref.sync import sync_to_async
 from bot_config import models as m
 
 
+# Prompt/setting edits made in the admin are picked up within this window
+CONFIG_CACHE_TTL_SECONDS = 300
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is missing or invalid."""
 
 
 class ConfigLoader:
-    """Primitive one-shot configuration loader using Django ORM."""
+    """Minimal configuration loader using Django ORM, with a short per-key TTL cache."""
 
     def __init__(self) -> None:
         from .database_config import get_database_config
         
         config = get_database_config()
+        # print, not logging: this runs at import time, before entrypoints configure logging
         print(config["description"])
         
         # Expose for legacy code – remove when callers are updated
@@ -37,11 +45,23 @@ class ConfigLoader:
         self.supabase_key: str = config["api_key"]
 
         self._env: str = os.getenv("ENVIRONMENT", "dev")
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+    def _cached(self, key: Tuple[str, str], fetch: Callable[[], Any]) -> Any:
+        hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < CONFIG_CACHE_TTL_SECONDS:
+            return hit[1]
+        value = fetch()
+        self._cache[key] = (time.monotonic(), value)
+        return value
 
     # ------------------------------------------------------------------
     # Public, minimal API used elsewhere in the code-base (Django ORM)
     # ------------------------------------------------------------------
     def get_setting(self, key: str) -> Any:
+        return self._cached(("setting", key), lambda: self._fetch_setting(key))
+
+    def _fetch_setting(self, key: str) -> Any:
         try:
             obj = m.ConfigSetting.objects.get(key=key)
             return obj.value
@@ -49,6 +69,9 @@ class ConfigLoader:
             raise ConfigurationError(f"Setting '{key}' not found")
 
     def get_prompt(self, name: str) -> str:
+        return self._cached(("prompt", name), lambda: self._fetch_prompt(name))
+
+    def _fetch_prompt(self, name: str) -> str:
         try:
             obj = m.TranslationPrompt.objects.get(name=name, is_active=True)
             return obj.content
@@ -56,6 +79,10 @@ class ConfigLoader:
             raise ConfigurationError(f"Prompt '{name}' not found")
 
     def get_ai_model_config(self) -> Dict[str, Any]:
+        # Copy so callers can apply overrides (e.g. TEMP_ANTHROPIC_*) without touching the cache
+        return dict(self._cached(("ai_model", "default"), self._fetch_ai_model_config))
+
+    def _fetch_ai_model_config(self) -> Dict[str, Any]:
         obj = m.AIModelConfig.objects.filter(is_default=True).first()
         if not obj:
             raise ConfigurationError("Default AI model config not found")
@@ -82,10 +109,13 @@ class ConfigLoader:
     
     async def aget_setting(self, key: str) -> Any:
         return await sync_to_async(self.get_setting)(key)
-    
+
     async def aget_article_extraction_config(self, domain: str) -> Dict[str, Any]:
         return await sync_to_async(self.get_article_extraction_config)(domain)
 
+    async def aget_processing_limits(self) -> Dict[str, Any]:
+        return await sync_to_async(self.get_processing_limits)()
+
     def get_processing_limits(self) -> Dict[str, Any]:
         obj = m.ProcessingLimits.objects.filter(environment=self._env).first()
         if not obj:
@@ -101,6 +131,9 @@ class ConfigLoader:
         }
 
     def get_article_extraction_config(self, domain: str) -> Dict[str, Any]:
+        return self._cached(("article_extraction", domain), lambda: self._fetch_article_extraction_config(domain))
+
+    def _fetch_article_extraction_config(self, domain: str) -> Dict[str, Any]:
         try:
             obj = m.ArticleExtractionConfig.objects.get(domain=domain)
             return {
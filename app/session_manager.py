@@ -11,14 +11,25 @@ No file-based sessions, everything in database for true persistence.
 
 import os
 import logging
-import json
 import base64
 import gzip
-from datetime import datetime, timedelta
+import io
+from datetime import datetime
 from telethon.sessions import StringSession
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so load/save round-trips reuse one keep-alive connection pool
+_http_client = None
+
+def _get_http_client():
+    """Return the process-wide httpx client for Supabase REST calls"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.Client()
+    return _http_client
+
 class DatabaseSession:
     """Telegram session stored in database"""
     
@@ -32,8 +43,10 @@ class DatabaseSession:
         self.supabase_url = _config.supabase_url
         self.supabase_key = _config.supabase_key
         
-        assert self.supabase_url, "Supabase URL missing from config"
-        assert self.supabase_key, "Supabase key missing from config"
+        if not self.supabase_url:
+            raise RuntimeError("Supabase URL missing from config")
+        if not self.supabase_key:
+            raise RuntimeError("Supabase key missing from config")
         self.use_database = True
     
     def save_session(self, session_string):
@@ -42,10 +55,11 @@ class DatabaseSession:
             return False
             
         try:
-            import httpx
-            
-            # Compress the session string
-            compressed = base64.b64encode(gzip.compress(session_string.encode())).decode()
+            # Compress the session string (mtime=0 keeps output deterministic across saves)
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=6, mtime=0) as gz:
+                gz.write(session_string.encode())
+            compressed = base64.b64encode(buf.getvalue()).decode()
             
             headers = {
                 'apikey': self.supabase_key,
@@ -63,7 +77,7 @@ class DatabaseSession:
             
             # Upsert session using POST with Prefer header for upsert
             headers['Prefer'] = 'resolution=merge-duplicates'
-            response = httpx.post(
+            response = _get_http_client().post(
                 f"{self.supabase_url}/rest/v1/telegram_sessions",
                 headers=headers,
                 json=data
@@ -86,14 +100,12 @@ class DatabaseSession:
             return None
             
         try:
-            import httpx
-            
             headers = {
                 'apikey': self.supabase_key,
                 'Authorization': f'Bearer {self.supabase_key}'
             }
             
-            response = httpx.get(
+            response = _get_http_client().get(
                 f"{self.supabase_url}/rest/v1/telegram_sessions",
                 headers=headers,
                 params={
@@ -23,7 +23,9 @@ logger = logging.getLogger(__name__)
 from .config_loader import get_config_loader
 
 OPENAI_KEY = os.getenv("OPENAI_API_KEY")
-assert OPENAI_KEY, "OPENAI_API_KEY environment variable is required, have you loaded .env file with dotenv?"
+if not OPENAI_KEY:
+    # Explicit raise: an assert would be stripped under python -O
+    raise RuntimeError("OPENAI_API_KEY environment variable is required, have you loaded .env file with dotenv?")
 _openai_client = openai.OpenAI(api_key=OPENAI_KEY)
 
 EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-ada-002")
@@ -75,10 +77,10 @@ def save_pair(  source_message_text: str,
     
     # Generate embedding over full context: original + full translation
     # This makes recalls consider the complete translated content, not just titles
-    embed_start = time.time()
+    embed_start = time.perf_counter()
     embedding_text = f"{source_message_text}\n\n{tgt}"
     vec = _embed(embedding_text)
-    embed_time = time.time() - embed_start
+    embed_time = time.perf_counter() - embed_start
     logger.debug(f"🔢 Generated embedding in {embed_time:.3f}s: {len(vec)} dimensions")
     
     # Prepare data
@@ -101,14 +103,26 @@ def save_pair(  source_message_text: str,
         data["conversation_log"] = conversation_log
     
     # Save to database
-    db_start = time.time()
+    db_start = time.perf_counter()
     result = _sb.table("article_chunks").upsert(data).execute()  # type: ignore
-    db_time = time.time() - db_start
+    db_time = time.perf_counter() - db_start
     
     logger.debug(f"💾 Database upsert completed in {db_time:.3f}s")
     logger.info(f"💾 Successfully saved pair {pair_id}: embed={embed_time:.3f}s, db={db_time:.3f}s, url={message_url}")
         
 
+def existing_pair_ids(pair_ids: List[str], batch_size: int = 200) -> set[str]:
+    """Return the subset of pair_ids already stored. Fails if store unavailable."""
+    found: set[str] = set()
+    # Batched so the id=in.(...) query string stays under gateway URL limits
+    for start in range(0, len(pair_ids), batch_size):
+        batch = pair_ids[start:start + batch_size]
+        res = _sb.table("article_chunks").select("id").in_("id", batch).execute()  # type: ignore
+        found.update(r["id"] for r in res.data or [])  # type: ignore
+    logger.debug(f"📋 {len(found)}/{len(pair_ids)} pair ids already stored")
+    return found
+
+
 def recall(source_message_text: str, k: int = 10, channel_name: str | None = None) -> List[Dict[str, Any]]:
     """Return ≤k most relevant past pairs. Optionally restrict to a specific channel name."""
     assert source_message_text, "Source text is required for recall"
@@ -117,20 +131,20 @@ def recall(source_message_text: str, k: int = 10, channel_name: str | None = Non
     
     try:
         # Generate embedding for query
-        embed_start = time.time()
+        embed_start = time.perf_counter()
         vec = _embed(source_message_text)
-        embed_time = time.time() - embed_start
+        embed_time = time.perf_counter() - embed_start
         logger.debug(f"🔢 Generated query embedding in {embed_time:.3f}s: {len(vec)} dimensions")
         
         # Query database
-        db_start = time.time()
+        db_start = time.perf_counter()
         # Fetch extra candidates to allow re-ranking by recency
         overfetch = int(k * 4)
         res = _sb.rpc(
             "match_article_chunks",
             {"query_embedding": vec, "match_count": overfetch},
         ).execute()  # type: ignore
-        db_time = time.time() - db_start
+        db_time = time.perf_counter() - db_start
         
         raw_results = res.data or []  # type: ignore
         # Channel-based filtering intentionally disabled: always search globally
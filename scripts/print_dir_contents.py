@@ -1,28 +1,37 @@
 import os
+import shutil
+import sys
+
+# Single buffered binary sink – flushed once in main()
+out = sys.stdout.buffer
+write = out.write
 
 def print_file_contents(file_path):
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            contents = f.read()
-            print(f"<<<<START of file {file_path}:>>>>")
-            print(contents)
-            print(f"<<<<END of file {file_path}:>>>>")
-    except UnicodeDecodeError:
-        # Binary file, ignore
-        pass
-    print()  # Separate files with an extra newline
+    with open(file_path, 'rb') as f:
+        # Sniff the first 4 KB for NUL bytes so binaries are rejected before any output
+        head = f.read(4096)
+        if b'\x00' in head:
+            return
+        write(b"<<<<START of file " + os.fsencode(file_path) + b":>>>>\n")
+        write(head)
+        shutil.copyfileobj(f, out)
+        write(b"\n<<<<END of file " + os.fsencode(file_path) + b":>>>>\n\n")
 
 def process_path(path):
     if os.path.isfile(path):
         print_file_contents(path)
     elif os.path.isdir(path):
-        for root, _, files in os.walk(path):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                print_file_contents(file_path)
+        # Iterative DFS over os.scandir – dirent type info avoids a stat() per entry
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        print_file_contents(entry.path)
     else:
-        print(f"Path not found: {path}")
-        print()
+        write(b"Path not found: " + os.fsencode(path) + b"\n\n")
 
 def main():
     # Multi-line string with each line as a file or directory path.
@@ -33,6 +42,7 @@ def main():
     paths = [line.strip() for line in paths_str.strip().splitlines() if line.strip()]
     for path in paths:
         process_path(path)
+    out.flush()
 
 if __name__ == "__main__":
     main()
@@ -21,20 +21,15 @@ import logging
 import os
 import re
 import sys
-import uuid
 
 # Add project root to path and check production safety
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from app.environment import assert_not_production
 assert_not_production()
 from pathlib import Path
-from typing import Tuple
 
 from dotenv import load_dotenv
-from telethon import events
-from telethon.tl.types import Message, InputChannel
-from telethon import utils
-from telethon.tl.functions.messages import GetHistoryRequest
+from telethon.tl.types import Message, MessageEntityTextUrl
 from telethon.errors import RPCError
 import telethon
 
@@ -72,9 +67,21 @@ def extract_translation_text(full_text: str) -> str:
     return parts[0].strip()
 
 
-def extract_original_msg_id(full_text: str) -> int | None:
-    """Find original message id from the 'Оригинал' link in the footer."""
-    match = ORIGINAL_LINK_RE.search(full_text)
+def extract_original_msg_id(msg: Message) -> int | None:
+    """Find original message id from the 'Оригинал' link in the footer.
+
+    The footer is posted as a markdown link, so it is normally available as a
+    MessageEntityTextUrl; the regex over the full text is only a fallback.
+    """
+    match = None
+    # Footer link is the last one in the post – scan entities from the end
+    for ent in reversed(msg.entities or []):
+        if isinstance(ent, MessageEntityTextUrl):
+            match = ORIGINAL_LINK_RE.match(ent.url)
+            if match:
+                break
+    if match is None:
+        match = ORIGINAL_LINK_RE.search(msg.text or "")
     if match:
         try:
             return int(match.group("msg_id"))
@@ -96,6 +103,14 @@ async def process_history(limit: int = 50) -> None:
         processed = 0
         saved = 0
 
+        # Skip pairs imported by a previous run – avoids re-embedding and re-upserting them.
+        # Only the fetched posts' candidate ids are checked, in one query.
+        orig_ids = {msg.id: extract_original_msg_id(msg) for msg in messages if msg.text}
+        existing = vector_store.existing_pair_ids(
+            [f"retro-{orig_id}" for orig_id in orig_ids.values() if orig_id is not None]
+        )
+        logger.info("Found %d previously imported retro pairs", len(existing))
+
         for msg in reversed(messages):  # oldest first
             processed += 1
             if not msg.text:
@@ -106,11 +121,15 @@ async def process_history(limit: int = 50) -> None:
                 logger.debug("Message %d has no translation text after stripping footer; skipping", msg.id)
                 continue
 
-            orig_id = extract_original_msg_id(msg.text)
+            orig_id = orig_ids[msg.id]
             if orig_id is None:
                 logger.debug("Could not find original message link in DST message %d; skipping", msg.id)
                 continue
 
+            if f"retro-{orig_id}" in existing:
+                logger.debug("Pair retro-%d already stored; skipping", orig_id)
+                continue
+
             try:
                 src_msg = await client.get_messages(src_ent, ids=orig_id)
             except RPCError as e:
@@ -121,18 +140,11 @@ async def process_history(limit: int = 50) -> None:
 
             # If the original message contains a URL to an article, extract & scrape it
             article_text = ""
-            if hasattr(src_msg, "entities") and src_msg.entities:
-                for ent in src_msg.entities:
-                    url = None
-                    if hasattr(ent, "url") and ent.url:
-                        url = ent.url
-                    elif getattr(ent, "_", "") in ("MessageEntityUrl", "MessageEntityTextUrl"):
-                        # Derive raw slice
-                        if hasattr(ent, "offset") and hasattr(ent, "length"):
-                            url_candidate = src_msg.raw_text[ent.offset : ent.offset + ent.length]
-                            if url_candidate.startswith("http"):
-                                url = url_candidate
-                    if url and url.startswith("http") and not url.startswith("https://t.me"):
+            if src_msg.entities:
+                # Hyperlinks only, matching bot.extract_message_urls so backfilled pairs get the same article
+                for ent, _ in src_msg.get_entities_text(MessageEntityTextUrl):
+                    url = ent.url
+                    if url.startswith("http") and not url.startswith("https://t.me"):
                         try:
                             from app.article_extractor import extract_article  # lazy import
 
@@ -45,7 +45,7 @@ import pytest # Added pytest
 # Adjust sys.path if necessary, or install the app as a package
 # For now, direct import if 'app' is discoverable (e.g. via PYTHONPATH or project structure)
 import app.bot
-from app.autogen_translation import translate_and_link
+from app.autogen_translation import aclose_model_clients, translate_and_link
 
 from telethon import TelegramClient
 from telethon.network import ConnectionTcpAbridged
@@ -109,7 +109,10 @@ async def test_api_translations(test_args):
     assert client, "Anthropic client could not be initialized. Check ANTHROPIC_API_KEY."
     logger.info("Testing modern Lurkmore style translation for Israeli Russian audience...")
     # Use new semantic linking approach with empty memory for this test
-    translation_result, conversation_log = await translate_and_link(TEST_MESSAGE, [])
+    try:
+        translation_result, conversation_log = await translate_and_link(TEST_MESSAGE, [])
+    finally:
+        await aclose_model_clients()  # pytest-asyncio gives each test its own loop
     assert translation_result and len(translation_result) > 10, "Modern Lurkmore style translation failed or returned empty/short result"
     assert conversation_log and len(conversation_log) > 0, "Editorial conversation log should not be empty"
     logger.info(f"Modern Lurkmore style translation successful: {translation_result[:100]}...")
@@ -257,6 +260,7 @@ async def test_telegram_pipeline(test_args):
         logger.error(f"Error in Telegram pipeline test: {str(e)}", exc_info=True)
         pytest.fail(f"Telegram pipeline test failed with an unexpected exception: {e}")
     finally:
+        await aclose_model_clients()  # translate_and_post filled this loop's client cache
         if client and client.is_connected():
             await client.disconnect()
             logger.info("Disconnected from Telegram")
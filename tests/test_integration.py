@@ -26,7 +26,7 @@ from app.autogen_translation import get_anthropic_client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.article_extractor import aextract_article
-from app.autogen_translation import translate_and_link
+from app.autogen_translation import aclose_model_clients, translate_and_link
 
 import pytest
 
@@ -116,6 +116,7 @@ async def test_article_extraction_integration():
         print("\n✅ Integration with semantic linking test successful!")
         
     finally:
+        await aclose_model_clients()  # pytest-asyncio gives each test its own loop
         # Cleanup test data
         from app.vector_store import _sb
         if _sb and test_ids: